@@ -1,12 +1,9 @@
 # flake8: noqa: E501
+import bisect
+import functools
 import hashlib
-from collections import defaultdict
-from pathlib import PosixPath
-from typing import DefaultDict, Dict, Iterable, List, Tuple
-
-from pydantic import parse_obj_as
-
-import physrisk.data.colormap_provider as colormap_provider
+from types import MappingProxyType
+from typing import Any, Dict, Final, Iterable, List, Optional, Sequence, Tuple
 
 from ..api.v1.hazard_data import HazardResource, Period
 
@@ -30,46 +27,41 @@ for more details.
     + methodology_doc
 )
 
-wri_colormap = {
-    "name": "flare",
-    "nodata_index": 0,
-    "min_index": 1,
-    "min_value": 0.0,
-    "max_index": 255,
-    "max_value": 2.0,
-    "units": "m",
-}
-
-
-class Inventory:
-    def __init__(self, hazard_resources: Iterable[HazardResource]):
-        """Store the hazard resources with look up via:
-        - key: combination of path and model identifier which is unique, or
-        - type and model identifier: (requires choice of provider/version)
+wri_colormap = MappingProxyType(
+    {
+        "name": "flare",
+        "nodata_index": 0,
+        "min_index": 1,
+        "min_value": 0.0,
+        "max_index": 255,
+        "max_value": 2.0,
+        "units": "m",
+    }
+)
 
-        Args:
-            hazard_resources (Iterable[HazardResource]): list of resources
-        """
-        self.resources: Dict[str, HazardResource] = {}
-        self.resources_by_type_id: DefaultDict[Tuple[str, str], List[HazardResource]] = defaultdict(list)
-        for resource in hazard_resources:
-            self.resources[resource.key()] = resource
-            self.resources_by_type_id[(resource.type, resource.id)].append(resource)
+# columns shared by many of the WRI models below
+wri_riverine_map = MappingProxyType(
+    {
+        "colormap": wri_colormap,
+        "array_name": "inunriver_{scenario}_{id}_{year}_rp{return_period:05d}",
+        "source": "mapbox",
+    }
+)
 
+wri_future_scenarios = (
+    {"id": "rcp4p5", "years": (2030, 2050, 2080)},
+    {"id": "rcp8p5", "years": (2030, 2050, 2080)},
+)
 
-class EmbeddedInventory:
-    """Contains an  of available hazard data.
-    path is given by {type}/{model group identifier}/{version}/{model identifier}
-    """
+wri_historical_scenarios = ({"id": "historical", "years": (1980,)},)
 
-    def __init__(self):
-        osc_chronic_heat_models = [
-            {
-                "type": "ChronicHeat",
-                "path": "chronic_heat/osc/v1",
-                "id": "mean_degree_days/above/32c",
-                "display_name": "Mean degree days above 32°C",
-                "description": """
+osc_chronic_heat_models = (
+    {
+        "type": "ChronicHeat",
+        "path": "chronic_heat/osc/v1",
+        "id": "mean_degree_days/above/32c",
+        "display_name": "Mean degree days above 32°C",
+        "description": """
 Degree days indicators are calculated by integrating over time the absolute difference in temperature
 of the medium over a reference temperature. The exact method of calculation may vary;
 here the daily average temperature is used to calculate an annual indicator:
@@ -86,35 +78,35 @@ Applications for indicators based on surface temperature degree days include mod
 - heating and cooling requirements
 - labour loss caused by extreme heat
 
-                """
-                + methodology_doc,
-                "array_name": "mean_degree_days_above_32c_{scenario}_{year}",
-                "map": {
-                    "colormap": {
-                        "name": "heating",
-                        "nodata_index": 0,
-                        "min_index": 1,
-                        "min_value": 0.0,
-                        "max_index": 255,
-                        "max_value": 3158.1914,
-                        "units": "degree-days",
-                    },
-                    "array_name": "mean_degree_days_above_32c_{scenario}_{year}",
-                    "source": "mapbox",
-                },
-                "units": "degree days",
-                "scenarios": [
-                    {"id": "ssp585", "years": [2030, 2040, 2050]},
-                    {"id": "historical", "years": [1980]},
-                ],
+        """
+        + methodology_doc,
+        "array_name": "mean_degree_days_above_32c_{scenario}_{year}",
+        "map": {
+            "colormap": {
+                "name": "heating",
+                "nodata_index": 0,
+                "min_index": 1,
+                "min_value": 0.0,
+                "max_index": 255,
+                "max_value": 3158.1914,
+                "units": "degree-days",
             },
-            {
-                "type": "ChronicHeat",
-                "path": "chronic_heat/osc/v1",
-                "id": "mean_work_loss/{intensity}",
-                "params": {"intensity": ["high", "medium", "low"]},
-                "display_name": "Mean work loss ({intensity} intensity)",
-                "description": """
+            "array_name": "mean_degree_days_above_32c_{scenario}_{year}",
+            "source": "mapbox",
+        },
+        "units": "degree days",
+        "scenarios": [
+            {"id": "ssp585", "years": (2030, 2040, 2050)},
+            {"id": "historical", "years": (1980,)},
+        ],
+    },
+    {
+        "type": "ChronicHeat",
+        "path": "chronic_heat/osc/v1",
+        "id": "mean_work_loss/{intensity}",
+        "params": {"intensity": ["high", "medium", "low"]},
+        "display_name": "Mean work loss ({intensity} intensity)",
+        "description": """
 The mean work loss indicator is calculated from the 'Wet Bulb Globe Temperature' (WBGT) indicator:
 $$
 I^\\text{WBGT}_i = 0.567 \\times T^\\text{avg}_i + 0.393 \\times P^\\text{vapour}_i
@@ -135,405 +127,424 @@ $$
 The OS-Climate-generated indicators are inferred from CMIP6 data, averaged over 6 models: ACCESS-CM2, CMCC-ESM2, CNRM-CM6-1, MPI-ESM1-2-LR, MIROC6 and NorESM2-MM.
 The indicators are generated for periods: 'historical' (averaged over 1995-2014), 2030 (2021-2040), 2040 (2031-2050) and 2050 (2041-2060).
 
-                """
-                + methodology_doc,
-                "array_name": "mean_work_loss_{intensity}_{scenario}_{year}",
-                "map": {
-                    "colormap": {
-                        "name": "heating",
-                        "nodata_index": 0,
-                        "min_index": 1,
-                        "min_value": 0.0,
-                        "max_index": 255,
-                        "max_value": 0.8,
-                        "units": "fractional loss",
-                    },
-                    "array_name": "mean_work_loss_{intensity}_{scenario}_{year}_map",
-                    "source": "array",
-                },
+        """
+        + methodology_doc,
+        "array_name": "mean_work_loss_{intensity}_{scenario}_{year}",
+        "map": {
+            "colormap": {
+                "name": "heating",
+                "nodata_index": 0,
+                "min_index": 1,
+                "min_value": 0.0,
+                "max_index": 255,
+                "max_value": 0.8,
                 "units": "fractional loss",
-                "scenarios": [
-                    {"id": "ssp585", "years": [2030, 2040, 2050]},
-                    {"id": "ssp245", "years": [2030, 2040, 2050]},
-                    {"id": "historical", "years": [2010]},
-                ],
             },
-        ]
+            "array_name": "mean_work_loss_{intensity}_{scenario}_{year}_map",
+            "source": "array",
+        },
+        "units": "fractional loss",
+        "scenarios": [
+            {"id": "ssp585", "years": (2030, 2040, 2050)},
+            {"id": "ssp245", "years": (2030, 2040, 2050)},
+            {"id": "historical", "years": (2010,)},
+        ],
+    },
+)
 
-        wri_riverine_inundation_models = [
-            {
-                "type": "RiverineInundation",
-                "path": "inundation/wri/v2",
-                "id": "000000000WATCH",
-                "display_name": "WRI/Baseline",
-                "description": """
+wri_riverine_inundation_models = (
+    {
+        "type": "RiverineInundation",
+        "path": "inundation/wri/v2",
+        "id": "000000000WATCH",
+        "display_name": "WRI/Baseline",
+        "description": """
 World Resources Institute Aqueduct Floods baseline riverine model using historical data.
 
-                """
-                + aqueduct_description,
-                "array_name": "inunriver_{scenario}_{id}_{year}",
-                "map": {
-                    "colormap": wri_colormap,
-                    "array_name": "inunriver_{scenario}_{id}_{year}_rp{return_period:05d}",
-                    "source": "mapbox",
-                },
-                "units": "metres",
-                "scenarios": [{"id": "historical", "years": [1980], "periods": [{"year": 1980, "map_id": "gw4vgq"}]}],
-            },
-            {
-                "type": "RiverineInundation",
-                "path": "inundation/wri/v2",
-                "id": "00000NorESM1-M",
-                "display_name": "WRI/NorESM1-M",
-                "description": """
+        """
+        + aqueduct_description,
+        "array_name": "inunriver_{scenario}_{id}_{year}",
+        "map": wri_riverine_map,
+        "units": "metres",
+        "scenarios": [{"id": "historical", "years": (1980,), "periods": [{"year": 1980, "map_id": "gw4vgq"}]}],
+    },
+    {
+        "type": "RiverineInundation",
+        "path": "inundation/wri/v2",
+        "id": "00000NorESM1-M",
+        "display_name": "WRI/NorESM1-M",
+        "description": """
 World Resources Institute Aqueduct Floods riverine model using GCM model from
 Bjerknes Centre for Climate Research, Norwegian Meteorological Institute.
 
-                """
-                + aqueduct_description,
-                "array_name": "inunriver_{scenario}_{id}_{year}",
-                "map": {
-                    "colormap": wri_colormap,
-                    "array_name": "inunriver_{scenario}_{id}_{year}_rp{return_period:05d}",
-                    "source": "mapbox",
-                },
-                "units": "metres",
-                "scenarios": [
-                    {"id": "rcp4p5", "years": [2030, 2050, 2080]},
-                    {"id": "rcp8p5", "years": [2030, 2050, 2080]},
-                ],
-            },
-            {
-                "type": "RiverineInundation",
-                "path": "inundation/wri/v2",
-                "id": "0000GFDL-ESM2M",
-                "display_name": "WRI/GFDL-ESM2M",
-                "description": """
+        """
+        + aqueduct_description,
+        "array_name": "inunriver_{scenario}_{id}_{year}",
+        "map": wri_riverine_map,
+        "units": "metres",
+        "scenarios": wri_future_scenarios,
+    },
+    {
+        "type": "RiverineInundation",
+        "path": "inundation/wri/v2",
+        "id": "0000GFDL-ESM2M",
+        "display_name": "WRI/GFDL-ESM2M",
+        "description": """
 World Resource Institute Aqueduct Floods riverine model using GCM model from
 Geophysical Fluid Dynamics Laboratory (NOAA).
 
-                """
-                + aqueduct_description,
-                "array_name": "inunriver_{scenario}_{id}_{year}",
-                "map": {
-                    "colormap": wri_colormap,
-                    "array_name": "inunriver_{scenario}_{id}_{year}_rp{return_period:05d}",
-                },
-                "units": "metres",
-                "scenarios": [
-                    {"id": "rcp4p5", "years": [2030, 2050, 2080]},
-                    {"id": "rcp8p5", "years": [2030, 2050, 2080]},
-                ],
-            },
-            {
-                "type": "RiverineInundation",
-                "path": "inundation/wri/v2",
-                "id": "0000HadGEM2-ES",
-                "display_name": "WRI/HadGEM2-ES",
-                "description": """
+        """
+        + aqueduct_description,
+        "array_name": "inunriver_{scenario}_{id}_{year}",
+        "map": {
+            "colormap": wri_colormap,
+            "array_name": "inunriver_{scenario}_{id}_{year}_rp{return_period:05d}",
+        },
+        "units": "metres",
+        "scenarios": wri_future_scenarios,
+    },
+    {
+        "type": "RiverineInundation",
+        "path": "inundation/wri/v2",
+        "id": "0000HadGEM2-ES",
+        "display_name": "WRI/HadGEM2-ES",
+        "description": """
 World Resource Institute Aqueduct Floods riverine model using GCM model:
 Met Office Hadley Centre.
 
-                """
-                + aqueduct_description,
-                "array_name": "inunriver_{scenario}_{id}_{year}",
-                "map": {
-                    "colormap": wri_colormap,
-                    "array_name": "inunriver_{scenario}_{id}_{year}_rp{return_period:05d}",
-                    "source": "mapbox",
-                },
-                "units": "metres",
-                "scenarios": [
-                    {"id": "rcp4p5", "years": [2030, 2050, 2080]},
-                    {"id": "rcp8p5", "years": [2030, 2050, 2080]},
-                ],
-            },
-            {
-                "type": "RiverineInundation",
-                "path": "inundation/wri/v2",
-                "id": "00IPSL-CM5A-LR",
-                "display_name": "WRI/IPSL-CM5A-LR",
-                "description": """
+        """
+        + aqueduct_description,
+        "array_name": "inunriver_{scenario}_{id}_{year}",
+        "map": wri_riverine_map,
+        "units": "metres",
+        "scenarios": wri_future_scenarios,
+    },
+    {
+        "type": "RiverineInundation",
+        "path": "inundation/wri/v2",
+        "id": "00IPSL-CM5A-LR",
+        "display_name": "WRI/IPSL-CM5A-LR",
+        "description": """
 World Resource Institute Aqueduct Floods riverine model using GCM model from
 Institut Pierre Simon Laplace
 
-                """
-                + aqueduct_description,
-                "array_name": "inunriver_{scenario}_{id}_{year}",
-                "map": {
-                    "colormap": wri_colormap,
-                    "array_name": "inunriver_{scenario}_{id}_{year}_rp{return_period:05d}",
-                    "source": "mapbox",
-                },
-                "units": "metres",
-                "scenarios": [
-                    {"id": "rcp4p5", "years": [2030, 2050, 2080]},
-                    {"id": "rcp8p5", "years": [2030, 2050, 2080]},
-                ],
-            },
-            {
-                "type": "RiverineInundation",
-                "path": "inundation/wri/v2",
-                "id": "MIROC-ESM-CHEM",
-                "display_name": "WRI/MIROC-ESM-CHEM",
-                "description": """World Resource Institute Aqueduct Floods riverine model using
+        """
+        + aqueduct_description,
+        "array_name": "inunriver_{scenario}_{id}_{year}",
+        "map": wri_riverine_map,
+        "units": "metres",
+        "scenarios": wri_future_scenarios,
+    },
+    {
+        "type": "RiverineInundation",
+        "path": "inundation/wri/v2",
+        "id": "MIROC-ESM-CHEM",
+        "display_name": "WRI/MIROC-ESM-CHEM",
+        "description": """World Resource Institute Aqueduct Floods riverine model using
  GCM model from Atmosphere and Ocean Research Institute
  (The University of Tokyo), National Institute for Environmental Studies, and Japan Agency
  for Marine-Earth Science and Technology.
 
-                """
-                + aqueduct_description,
-                "array_name": "inunriver_{scenario}_{id}_{year}",
-                "map": {
-                    "colormap": wri_colormap,
-                    "array_name": "inunriver_{scenario}_{id}_{year}_rp{return_period:05d}",
-                    "source": "mapbox",
-                },
-                "units": "metres",
-                "scenarios": [
-                    {
-                        "id": "rcp4p5",
-                        "years": [2030, 2050, 2080],
-                        "periods": [
-                            {"year": 2030, "map_id": "ht2kn3"},
-                            {"year": 2050, "map_id": "1k4boi"},
-                            {"year": 2080, "map_id": "3rok7b"},
-                        ],
-                    },
-                    {"id": "rcp8p5", "years": [2030, 2050, 2080]},
+        """
+        + aqueduct_description,
+        "array_name": "inunriver_{scenario}_{id}_{year}",
+        "map": wri_riverine_map,
+        "units": "metres",
+        "scenarios": [
+            {
+                "id": "rcp4p5",
+                "years": (2030, 2050, 2080),
+                "periods": [
+                    {"year": 2030, "map_id": "ht2kn3"},
+                    {"year": 2050, "map_id": "1k4boi"},
+                    {"year": 2080, "map_id": "3rok7b"},
                 ],
             },
-        ]
+            {"id": "rcp8p5", "years": (2030, 2050, 2080)},
+        ],
+    },
+)
 
-        wri_coastal_inundation_models = [
-            {
-                "type": "CoastalInundation",
-                "path": "inundation/wri/v2",
-                "id": "nosub",
-                "display_name": "WRI/Baseline no subsidence",
-                "description": """
+wri_coastal_inundation_models = (
+    {
+        "type": "CoastalInundation",
+        "path": "inundation/wri/v2",
+        "id": "nosub",
+        "display_name": "WRI/Baseline no subsidence",
+        "description": """
 World Resources Institute Aqueduct Floods baseline coastal model using historical data. Model excludes subsidence.
 
-                """
-                + aqueduct_description,
-                "array_name": "inuncoast_historical_nosub_hist_0",
-                "map": {
-                    "colormap": wri_colormap,
-                    "array_name": "inuncoast_historical_nosub_hist_rp{return_period:04d}_0",
-                    "source": "mapbox",
-                },
-                "units": "metres",
-                "scenarios": [{"id": "historical", "years": [1980]}],
-            },
-            {
-                "type": "CoastalInundation",
-                "path": "inundation/wri/v2",
-                "id": "nosub/95",
-                "display_name": "WRI/95% no subsidence",
-                "description": """
+        """
+        + aqueduct_description,
+        "array_name": "inuncoast_historical_nosub_hist_0",
+        "map": {
+            "colormap": wri_colormap,
+            "array_name": "inuncoast_historical_nosub_hist_rp{return_period:04d}_0",
+            "source": "mapbox",
+        },
+        "units": "metres",
+        "scenarios": wri_historical_scenarios,
+    },
+    {
+        "type": "CoastalInundation",
+        "path": "inundation/wri/v2",
+        "id": "nosub/95",
+        "display_name": "WRI/95% no subsidence",
+        "description": """
 World Resource Institute Aqueduct Floods coastal model, exclusing subsidence; 95th percentile sea level rise.
 
-                """
-                + aqueduct_description,
-                "array_name": "inuncoast_{scenario}_nosub_{year}_0",
-                "map": {
-                    "colormap": wri_colormap,
-                    "array_name": "inuncoast_{scenario}_nosub_{year}_rp{return_period:04d}_0",
-                    "source": "mapbox",
-                },
-                "units": "metres",
-                "scenarios": [
-                    {"id": "rcp4p5", "years": [2030, 2050, 2080]},
-                    {"id": "rcp8p5", "years": [2030, 2050, 2080]},
-                ],
-            },
-            {
-                "type": "CoastalInundation",
-                "path": "inundation/wri/v2",
-                "id": "nosub/5",
-                "display_name": "WRI/5% no subsidence",
-                "description": """
+        """
+        + aqueduct_description,
+        "array_name": "inuncoast_{scenario}_nosub_{year}_0",
+        "map": {
+            "colormap": wri_colormap,
+            "array_name": "inuncoast_{scenario}_nosub_{year}_rp{return_period:04d}_0",
+            "source": "mapbox",
+        },
+        "units": "metres",
+        "scenarios": wri_future_scenarios,
+    },
+    {
+        "type": "CoastalInundation",
+        "path": "inundation/wri/v2",
+        "id": "nosub/5",
+        "display_name": "WRI/5% no subsidence",
+        "description": """
 World Resource Institute Aqueduct Floods coastal model, excluding subsidence; 5th percentile sea level rise.
 
-                """
-                + aqueduct_description,
-                "array_name": "inuncoast_{scenario}_nosub_{year}_0_perc_05",
-                "map": {
-                    "colormap": wri_colormap,
-                    "array_name": "inuncoast_{scenario}_nosub_{year}_rp{return_period:04d}_0_perc_05",
-                    "source": "mapbox",
-                },
-                "units": "metres",
-                "scenarios": [
-                    {"id": "rcp4p5", "years": [2030, 2050, 2080]},
-                    {"id": "rcp8p5", "years": [2030, 2050, 2080]},
-                ],
-            },
-            {
-                "type": "CoastalInundation",
-                "path": "inundation/wri/v2",
-                "id": "nosub/50",
-                "display_name": "WRI/50% no subsidence",
-                "description": """
+        """
+        + aqueduct_description,
+        "array_name": "inuncoast_{scenario}_nosub_{year}_0_perc_05",
+        "map": {
+            "colormap": wri_colormap,
+            "array_name": "inuncoast_{scenario}_nosub_{year}_rp{return_period:04d}_0_perc_05",
+            "source": "mapbox",
+        },
+        "units": "metres",
+        "scenarios": wri_future_scenarios,
+    },
+    {
+        "type": "CoastalInundation",
+        "path": "inundation/wri/v2",
+        "id": "nosub/50",
+        "display_name": "WRI/50% no subsidence",
+        "description": """
 World Resource Institute Aqueduct Floods model, excluding subsidence; 50th percentile sea level rise.
 
-                """
-                + aqueduct_description,
-                "array_name": "inuncoast_{scenario}_nosub_{year}_0_perc_50",
-                "map": {
-                    "colormap": wri_colormap,
-                    "array_name": "inuncoast_{scenario}_nosub_{year}_rp{return_period:04d}_0_perc_50",
-                    "source": "mapbox",
-                },
-                "units": "metres",
-                "scenarios": [
-                    {"id": "rcp4p5", "years": [2030, 2050, 2080]},
-                    {"id": "rcp8p5", "years": [2030, 2050, 2080]},
-                ],
-            },
-            {
-                "type": "CoastalInundation",
-                "path": "inundation/wri/v2",
-                "id": "wtsub",
-                "display_name": "WRI/Baseline with subsidence",
-                "description": """
+        """
+        + aqueduct_description,
+        "array_name": "inuncoast_{scenario}_nosub_{year}_0_perc_50",
+        "map": {
+            "colormap": wri_colormap,
+            "array_name": "inuncoast_{scenario}_nosub_{year}_rp{return_period:04d}_0_perc_50",
+            "source": "mapbox",
+        },
+        "units": "metres",
+        "scenarios": wri_future_scenarios,
+    },
+    {
+        "type": "CoastalInundation",
+        "path": "inundation/wri/v2",
+        "id": "wtsub",
+        "display_name": "WRI/Baseline with subsidence",
+        "description": """
 World Resource Institute Aqueduct Floods model, excluding subsidence; baseline (based on historical data).
 
-                """
-                + aqueduct_description,
-                "array_name": "inuncoast_historical_wtsub_hist_0",
-                "map": {
-                    "colormap": wri_colormap,
-                    "array_name": "inuncoast_historical_wtsub_hist_rp{return_period:04d}_0",
-                    "source": "mapbox",
-                },
-                "units": "metres",
-                "scenarios": [{"id": "historical", "years": [1980]}],
-            },
-            {
-                "type": "CoastalInundation",
-                "path": "inundation/wri/v2",
-                "id": "wtsub/95",
-                "display_name": "WRI/95% with subsidence",
-                "description": """
+        """
+        + aqueduct_description,
+        "array_name": "inuncoast_historical_wtsub_hist_0",
+        "map": {
+            "colormap": wri_colormap,
+            "array_name": "inuncoast_historical_wtsub_hist_rp{return_period:04d}_0",
+            "source": "mapbox",
+        },
+        "units": "metres",
+        "scenarios": wri_historical_scenarios,
+    },
+    {
+        "type": "CoastalInundation",
+        "path": "inundation/wri/v2",
+        "id": "wtsub/95",
+        "display_name": "WRI/95% with subsidence",
+        "description": """
 World Resource Institute Aqueduct Floods model, including subsidence; 95th percentile sea level rise.
 
-                """
-                + aqueduct_description,
-                "array_name": "inuncoast_{scenario}_wtsub_{year}_0",
-                "map": {
-                    "colormap": wri_colormap,
-                    "array_name": "inuncoast_{scenario}_wtsub_{year}_rp{return_period:04d}_0",
-                    "source": "mapbox",
-                },
-                "units": "metres",
-                "scenarios": [
-                    {"id": "rcp4p5", "years": [2030, 2050, 2080]},
-                    {"id": "rcp8p5", "years": [2030, 2050, 2080]},
-                ],
-            },
-            {
-                "type": "CoastalInundation",
-                "path": "inundation/wri/v2",
-                "id": "wtsub/5",
-                "display_name": "WRI/5% with subsidence",
-                "description": """
+        """
+        + aqueduct_description,
+        "array_name": "inuncoast_{scenario}_wtsub_{year}_0",
+        "map": {
+            "colormap": wri_colormap,
+            "array_name": "inuncoast_{scenario}_wtsub_{year}_rp{return_period:04d}_0",
+            "source": "mapbox",
+        },
+        "units": "metres",
+        "scenarios": wri_future_scenarios,
+    },
+    {
+        "type": "CoastalInundation",
+        "path": "inundation/wri/v2",
+        "id": "wtsub/5",
+        "display_name": "WRI/5% with subsidence",
+        "description": """
 World Resource Institute Aqueduct Floods model, including subsidence; 5th percentile sea level rise.
 
-                """
-                + aqueduct_description,
-                "array_name": "inuncoast_{scenario}_wtsub_{year}_0_perc_05",
-                "map": {
-                    "colormap": wri_colormap,
-                    "array_name": "inuncoast_{scenario}_wtsub_{year}_rp{return_period:04d}_0_perc_05",
-                    "source": "mapbox",
-                },
-                "units": "metres",
-                "scenarios": [
-                    {"id": "rcp4p5", "years": [2030, 2050, 2080]},
-                    {"id": "rcp8p5", "years": [2030, 2050, 2080]},
-                ],
-            },
-            {
-                "type": "CoastalInundation",
-                "path": "inundation/wri/v2",
-                "id": "wtsub/50",
-                "display_name": "WRI/50% with subsidence",
-                "description": """
+        """
+        + aqueduct_description,
+        "array_name": "inuncoast_{scenario}_wtsub_{year}_0_perc_05",
+        "map": {
+            "colormap": wri_colormap,
+            "array_name": "inuncoast_{scenario}_wtsub_{year}_rp{return_period:04d}_0_perc_05",
+            "source": "mapbox",
+        },
+        "units": "metres",
+        "scenarios": wri_future_scenarios,
+    },
+    {
+        "type": "CoastalInundation",
+        "path": "inundation/wri/v2",
+        "id": "wtsub/50",
+        "display_name": "WRI/50% with subsidence",
+        "description": """
 World Resource Institute Aqueduct Floods model, including subsidence; 50th percentile sea level rise.
 
-                """
-                + aqueduct_description,
-                "array_name": "inuncoast_{scenario}_wtsub_{year}_0_perc_50",
-                "map": {
-                    "colormap": wri_colormap,
-                    "array_name": "inuncoast_{scenario}_wtsub_{year}_rp{return_period:04d}_0_perc_50",
-                    "source": "mapbox",
-                },
-                "units": "metres",
-                "scenarios": [
-                    {"id": "rcp4p5", "years": [2030, 2050, 2080]},
-                    {"id": "rcp8p5", "years": [2030, 2050, 2080]},
-                ],
-            },
-        ]
-
-        self.models = osc_chronic_heat_models + wri_riverine_inundation_models + wri_coastal_inundation_models
-
-    def to_resources(self) -> List[HazardResource]:
-        models = parse_obj_as(List[HazardResource], self.models)
-        expanded_models = [e for model in models for e in model.expand()]
-        # we populate map_id hashes programmatically
-        for model in expanded_models:
-            for scenario in model.scenarios:
-                test_periods = scenario.periods
-                scenario.periods = []
-                for year in scenario.years:
-                    if model.map and model.map.array_name:
-                        name_format = model.map.array_name
-                        array_name = name_format.format(
-                            scenario=scenario.id, year=year, id=model.id, return_period=1000
-                        )
-                        id = alphanumeric(array_name)[0:6]
-                    else:
-                        id = ""
-                    scenario.periods.append(Period(year=year, map_id=id))
-                # if a period was specified explicitly, we check that hash is the same: a build-in check
-                if test_periods is not None:
-                    for period, test_period in zip(scenario.periods, test_periods):
-                        if period.map_id != test_period.map_id:
-                            raise Exception(
-                                f"validation error: hash {period.map_id} different to specified hash {test_period.map_id}"  # noqa: E501
-                            )
-
-        return expanded_models
+        """
+        + aqueduct_description,
+        "array_name": "inuncoast_{scenario}_wtsub_{year}_0_perc_50",
+        "map": {
+            "colormap": wri_colormap,
+            "array_name": "inuncoast_{scenario}_wtsub_{year}_rp{return_period:04d}_0_perc_50",
+            "source": "mapbox",
+        },
+        "units": "metres",
+        "scenarios": wri_future_scenarios,
+    },
+)
+
+_MODELS: Final[Tuple[Dict[str, Any], ...]] = (
+    osc_chronic_heat_models + wri_riverine_inundation_models + wri_coastal_inundation_models
+)
+
+
+class Inventory:
+    def __init__(self, hazard_resources: Iterable[HazardResource]):
+        """Store the hazard resources with look up via:
+        - key: combination of path and model identifier which is unique, or
+        - type and model identifier: (requires choice of provider/version)
+
+        Args:
+            hazard_resources (Iterable[HazardResource]): list of resources
+        """
+        # hazard_resources may be an iterator, so materialise before making two passes
+        resources = list(hazard_resources)
+        self.resources: Dict[str, HazardResource] = {r.key(): r for r in resources}
+        resources_by_type_id: Dict[Tuple[str, str], List[HazardResource]] = {}
+        for resource in resources:
+            resources_by_type_id.setdefault((resource.type, resource.id), []).append(resource)
+        self.resources_by_type_id = resources_by_type_id
+
+
+class EmbeddedInventory:
+    """Contains an  of available hazard data.
+    path is given by {type}/{model group identifier}/{version}/{model identifier}
+    """
+
+    def __init__(self):
+        self.models = _MODELS
+
+    def to_resources(self) -> Sequence[HazardResource]:
+        """Return the embedded hazard resources; these are built once and shared."""
+        return _build_embedded_resources()
 
     def colormaps(self):
         """Color maps. Key can be identical to a model identifier or more descriptive (if shared by many models)."""
+        import physrisk.data.colormap_provider as colormap_provider
+
         return colormap_provider.colormaps
 
 
-def alphanumeric(text):
+@functools.lru_cache(maxsize=1)
+def _build_embedded_resources() -> Tuple[HazardResource, ...]:
+    """Parse and expand the embedded models, populating the map_id hashes; the (static) result is cached."""
+    models = [HazardResource.parse_obj(m) for m in _MODELS]
+    expanded_models = [e for model in models for e in model.expand()]
+    # we populate map_id hashes programmatically; those specified explicitly are used as-is
+    # (see validate_embedded_inventory)
+    for model in expanded_models:
+        name_format = model.map.array_name if model.map and model.map.array_name else None
+        model_id = model.id
+        for scenario in model.scenarios:
+            if scenario.periods is None:
+                map_ids = _map_ids(name_format, model_id, scenario.id, scenario.years)
+                scenario.periods = [Period(year=year, map_id=map_id) for year, map_id in zip(scenario.years, map_ids)]
+
+    return tuple(expanded_models)
+
+
+def validate_embedded_inventory():
+    """Check that map_ids specified explicitly in the embedded inventory are the same as the calculated hashes.
+    These are not re-calculated when the resources are built, so this is intended to be run from tests.
+    """
+    for model in EmbeddedInventory().to_resources():
+        name_format = model.map.array_name if model.map and model.map.array_name else None
+        for scenario in model.scenarios:
+            map_ids = _map_ids(name_format, model.id, scenario.id, scenario.years)
+            for period, map_id in zip(scenario.periods or [], map_ids):
+                if period.map_id != map_id:
+                    raise Exception(f"validation error: hash {map_id} different to specified hash {period.map_id}")
+
+
+def _map_ids(name_format: Optional[str], model_id: str, scenario_id: str, years: Iterable[int]) -> List[str]:
+    """Return the map_ids of a given scenario for each of the years: hashes of the names of the map arrays."""
+    if not name_format:
+        return ["" for _ in years]
+    # arguments other than the year are bound once for the scenario
+    format_args = {"scenario": scenario_id, "id": model_id, "return_period": 1000}
+    map_ids = []
+    for year in years:
+        format_args["year"] = year
+        map_ids.append(short_hash(name_format.format_map(format_args)))
+    return map_ids
+
+
+# powers of 36 covering the range of a SHA-1 (160 bit) hash
+_base36_powers = tuple(36**i for i in range(32))
+
+
+def alphanumeric(text: str):
     """Return alphanumeric hash from supplied string."""
     hash_int = int.from_bytes(hashlib.sha1(text.encode("utf-8")).digest(), "big")
     return base36encode(hash_int)
 
 
+@functools.lru_cache(maxsize=512)
+def short_hash(text: str, length: int = 6):
+    """Return the leading length characters of the alphanumeric hash of the supplied string; only
+    these characters are calculated.
+    Note that map_ids, used to look up map tiles, are generated from this: the hash algorithm
+    should not be changed without regenerating the tile sets."""
+    hash_int = int.from_bytes(hashlib.sha1(text.encode("utf-8")).digest(), "big")
+    # drop the trailing digits with a single division rather than encoding them
+    digits = bisect.bisect_right(_base36_powers, hash_int)
+    if digits > length:
+        hash_int //= _base36_powers[digits - length]
+    return base36encode(hash_int)
+
+
 def base36encode(number, alphabet="0123456789abcdefghijklmnopqrstuvwxyz"):
     """Converts an integer to a base36 string."""
     if not isinstance(number, int):
         raise TypeError("number must be an integer")
 
-    base36 = ""
-
     if number < 0:
         raise TypeError("number must be positive")
 
-    if 0 <= number < len(alphabet):
+    base = len(alphabet)
+    if number < base:
         return alphabet[number]
 
+    digits = []
     while number != 0:
-        number, i = divmod(number, len(alphabet))
-        base36 = alphabet[i] + base36
+        number, i = divmod(number, base)
+        digits.append(alphabet[i])
 
-    return base36
+    return "".join(reversed(digits))
@@ -0,0 +1,18 @@
+import unittest
+
+from physrisk.data.inventory import EmbeddedInventory, alphanumeric, short_hash, validate_embedded_inventory
+
+
+class TestInventory(unittest.TestCase):
+    def test_short_hash(self):
+        for text in ["", "inunriver_historical_000000000WATCH_1980_rp01000", "mean_degree_days_above_32c_ssp585_2030"]:
+            full = alphanumeric(text)
+            for length in [1, 6, len(full), len(full) + 1]:
+                self.assertEqual(short_hash(text, length), full[0:length])
+
+    def test_embedded_map_ids(self):
+        # map_ids specified explicitly in the embedded inventory are not re-calculated, so check these here
+        for model in EmbeddedInventory().to_resources():
+            for scenario in model.scenarios:
+                self.assertEqual([p.year for p in scenario.periods], scenario.years)
+        validate_embedded_inventory()